@@ -141,20 +141,9 @@ func GetRunningEnvironment() string {
 func MetricsCollectorService(serviceName string) string {
 	var environment string
 
-	if GetRunningEnvironment() == StagingEnv {
-		environment = StagingEnv
-	}
-
-	if GetRunningEnvironment() == TestingEnv {
-		environment = TestingEnv
-	}
-
-	if GetRunningEnvironment() == DemoEnv {
-		environment = DemoEnv
-	}
-
-	if GetRunningEnvironment() == ProdEnv {
-		environment = ProdEnv
+	switch runningEnvironment := GetRunningEnvironment(); runningEnvironment {
+	case StagingEnv, TestingEnv, DemoEnv, ProdEnv:
+		environment = runningEnvironment
 	}
 
 	return fmt.Sprintf("%s-%s", serviceName, environment)